@@ -1,8 +1,12 @@
 """Game solving algorithms for Sum10 puzzle."""
 
-from typing import List, Tuple, Dict, Set
+from typing import List, Tuple, Dict, Set, Optional
 from abc import ABC, abstractmethod
 import logging
+import multiprocessing
+import os
+import random
+import time
 
 logger = logging.getLogger(__name__)
 
@@ -11,6 +15,8 @@ Matrix = List[List[int]]
 Coordinate = Tuple[int, int, int, int]  # x1, y1, x2, y2
 Operation = List[Coordinate]
 
+TARGET_SUM = 10
+
 
 class BaseSolver(ABC):
     """Base class for Sum10 solvers."""
@@ -19,7 +25,7 @@ class BaseSolver(ABC):
         self.matrix = [row[:] for row in matrix]  # Deep copy
         self.num_rows = len(matrix)
         self.num_cols = len(matrix[0]) if matrix else 0
-        self.target_sum = 10
+        self.target_sum = TARGET_SUM
     
     @abstractmethod
     def solve(self) -> Tuple[int, Operation]:
@@ -199,6 +205,182 @@ class GreedySolver(BaseSolver):
         return total_points, self.operations
 
 
+def _find_moves(board: Matrix) -> List[Tuple[Coordinate, int]]:
+    """Enumerate every tight sum-10 rectangle on the board with its points.
+
+    A rectangle is tight when each of its four edges holds a non-zero cell,
+    so padding a move with already-cleared cells is not reported twice.
+    """
+    num_rows = len(board)
+    num_cols = len(board[0]) if board else 0
+    prefix_sum = [[0] * (num_cols + 1) for _ in range(num_rows + 1)]
+    prefix_cnt = [[0] * (num_cols + 1) for _ in range(num_rows + 1)]
+    for i in range(num_rows):
+        row = board[i]
+        for j in range(num_cols):
+            prefix_sum[i+1][j+1] = (prefix_sum[i][j+1] + prefix_sum[i+1][j] -
+                                    prefix_sum[i][j] + row[j])
+            prefix_cnt[i+1][j+1] = (prefix_cnt[i][j+1] + prefix_cnt[i+1][j] -
+                                    prefix_cnt[i][j] + (row[j] != 0))
+
+    def count(x1: int, y1: int, x2: int, y2: int) -> int:
+        return (prefix_cnt[x2+1][y2+1] + prefix_cnt[x1][y1] -
+                prefix_cnt[x1][y2+1] - prefix_cnt[x2+1][y1])
+
+    moves = []
+    for x1 in range(num_rows):
+        for y1 in range(num_cols):
+            for x2 in range(x1, num_rows):
+                # Cell values are non-negative, so sums only grow with size
+                if (prefix_sum[x2+1][y1+1] - prefix_sum[x1][y1+1] -
+                        prefix_sum[x2+1][y1] + prefix_sum[x1][y1]) > TARGET_SUM:
+                    break
+                for y2 in range(y1, num_cols):
+                    current_sum = (prefix_sum[x2+1][y2+1] + prefix_sum[x1][y1] -
+                                   prefix_sum[x1][y2+1] - prefix_sum[x2+1][y1])
+                    if current_sum > TARGET_SUM:
+                        break
+                    if current_sum < TARGET_SUM:
+                        continue
+                    if (count(x1, y1, x1, y2) and count(x2, y1, x2, y2) and
+                            count(x1, y1, x2, y1) and count(x1, y2, x2, y2)):
+                        moves.append(((x1, y1, x2, y2), count(x1, y1, x2, y2)))
+    return moves
+
+
+def _apply_move(board: Matrix, coordinate: Coordinate) -> None:
+    """Clear every cell covered by the move."""
+    x1, y1, x2, y2 = coordinate
+    for i in range(x1, x2 + 1):
+        for j in range(y1, y2 + 1):
+            board[i][j] = 0
+
+
+def _rollout(matrix: Matrix, rng: random.Random, prefix: Operation,
+             bias: float, shared_best=None) -> Tuple[int, Operation]:
+    """Replay a prefix of moves, then play random moves until none are left.
+
+    Moves clearing fewer cells are preferred, since they leave more numbers
+    on the board to combine later. The rollout is abandoned as soon as it can
+    no longer beat the best score found by any worker.
+    """
+    board = [row[:] for row in matrix]
+    remaining = sum(1 for row in board for value in row if value != 0)
+    points = 0
+    operations: Operation = []
+
+    for coordinate in prefix:
+        cleared = sum(1 for i in range(coordinate[0], coordinate[2] + 1)
+                      for j in range(coordinate[1], coordinate[3] + 1)
+                      if board[i][j] != 0)
+        _apply_move(board, coordinate)
+        points += cleared
+        remaining -= cleared
+        operations.append(coordinate)
+
+    while True:
+        if shared_best is not None and points + remaining <= shared_best.value:
+            return points, operations
+        moves = _find_moves(board)
+        if not moves:
+            return points, operations
+        weights = [bias ** -move_points for _, move_points in moves]
+        coordinate, move_points = rng.choices(moves, weights)[0]
+        _apply_move(board, coordinate)
+        points += move_points
+        remaining -= move_points
+        operations.append(coordinate)
+
+
+_shared_best = None
+
+
+def _init_rollout_worker(shared_best) -> None:
+    """Store the shared best score in the worker process."""
+    global _shared_best
+    _shared_best = shared_best
+
+
+def _run_rollouts(matrix: Matrix, seed: Optional[int], time_budget: float,
+                  max_rollouts: Optional[int], bias: float,
+                  shared_best=None) -> Tuple[int, Operation]:
+    """Run rollouts until the deadline and return the best one found.
+
+    Half of the rollouts start from a random-length prefix of the best line
+    found so far, so the search keeps refining it instead of only sampling
+    from the initial board.
+    """
+    if shared_best is None:
+        shared_best = _shared_best
+    deadline = time.monotonic() + time_budget
+    rng = random.Random(seed)
+    best_points, best_operations = 0, []
+    rollouts = 0
+
+    while time.monotonic() < deadline:
+        if max_rollouts is not None and rollouts >= max_rollouts:
+            break
+        prefix: Operation = []
+        if best_operations and rng.random() < 0.5:
+            prefix = best_operations[:rng.randrange(len(best_operations))]
+        points, operations = _rollout(matrix, rng, prefix, bias, shared_best)
+        rollouts += 1
+
+        if points > best_points:
+            best_points, best_operations = points, operations
+            if shared_best is not None:
+                with shared_best.get_lock():
+                    if points > shared_best.value:
+                        shared_best.value = points
+
+    logger.debug(f"Worker finished {rollouts} rollouts, best {best_points} points")
+    return best_points, best_operations
+
+
+class MonteCarloSolver(BaseSolver):
+    """Randomized rollout solver running on multiple worker processes."""
+
+    def __init__(self, matrix: Matrix, time_budget: float = 5.0,
+                 num_workers: Optional[int] = None, seed: Optional[int] = None,
+                 max_rollouts: Optional[int] = None, bias: float = 4.0):
+        """
+        Args:
+            matrix: Game board matrix
+            time_budget: Seconds to spend searching
+            num_workers: Number of worker processes, defaults to the CPU count
+            seed: Seed for the random number generators, for reproducible runs
+                use it together with max_rollouts and a single worker
+            max_rollouts: Optional cap on rollouts per worker
+            bias: How strongly rollouts prefer moves clearing fewer cells
+        """
+        super().__init__(matrix)
+        self.time_budget = time_budget
+        self.num_workers = num_workers or os.cpu_count() or 1
+        self.seed = seed
+        self.max_rollouts = max_rollouts
+        self.bias = bias
+
+    def solve(self) -> Tuple[int, Operation]:
+        """Solve using randomized rollouts and return the best line found."""
+        rng = random.Random(self.seed)
+        seeds = [rng.getrandbits(64) for _ in range(self.num_workers)]
+
+        if self.num_workers == 1:
+            results = [_run_rollouts(self.matrix, seeds[0], self.time_budget,
+                                     self.max_rollouts, self.bias)]
+        else:
+            shared_best = multiprocessing.Value('i', 0)
+            tasks = [(self.matrix, seed, self.time_budget, self.max_rollouts, self.bias)
+                     for seed in seeds]
+            with multiprocessing.Pool(self.num_workers, _init_rollout_worker,
+                                      (shared_best,)) as pool:
+                results = pool.starmap(_run_rollouts, tasks)
+
+        max_points, best_operation = max(results, key=lambda result: result[0])
+        logger.info(f"Total points from Monte-Carlo solving: {max_points}")
+        return max_points, best_operation
+
+
 def solve_board_by_chunks(matrix: Matrix, chunk_size: int) -> Operation:
     """
     Solve board by dividing it into chunks.